@@ -0,0 +1,210 @@
+"""
+How it works: archive_table() moves aged rows out of a hot SQLite table into compressed Parquet files laid out as
+<ARCHIVE_ROOT>/<table>/dt=YYYY-MM-DD/part-*.parquet, partitioned by the calendar date of the row's time column.
+Only complete days are exported, so each partition normally holds a single file. Exactly the exported rows are deleted
+from SQLite, and only after their Parquet files have been written; a retried export overwrites the same file names,
+so a failure between writing and deleting does not leave duplicates behind.
+
+query_archive() reads those files back for long-range RCA and trend analysis without touching the hot databases.
+Only the dt= partitions overlapping the requested time window are opened, and only the requested columns are read.
+
+Example:
+    from data_archiver import query_archive
+    df = query_archive("historical_incidents", start="2025-01-01", end="2025-02-01",
+                       columns=["application", "category", "priority", "created_at"])
+"""
+
+import os
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Root directory for all archived tables (one sub-directory per table)
+ARCHIVE_ROOT = "/mnt/data/archive"
+# Compression codec for archived Parquet files
+COMPRESSION = "snappy"
+
+# Schema and partitioning time column of every table that can be archived.
+# Keep these in sync with the CREATE TABLE statements; archive_table() raises if they differ.
+ARCHIVE_TABLES = {
+    "historical_incidents": {
+        "time_column": "created_at",
+        "schema": pa.schema([
+            ("id", pa.int64()),
+            ("original_ticket_id", pa.int64()),
+            ("application", pa.string()),
+            ("server", pa.string()),
+            ("error_type", pa.string()),
+            ("issue_summary", pa.string()),
+            ("priority", pa.string()),
+            ("category", pa.string()),
+            ("status", pa.string()),
+            ("resolution_time", pa.string()),
+            ("rca_notes", pa.string()),
+            ("created_at", pa.string())
+        ])
+    },
+    "real_time_monitoring": {
+        "time_column": "timestamp",
+        "schema": pa.schema([
+            ("timestamp", pa.string()),
+            ("server", pa.string()),
+            ("cpu_usage", pa.float64()),
+            ("memory_usage", pa.float64()),
+            ("disk_usage", pa.float64()),
+            ("network_usage", pa.float64())
+        ])
+    },
+    "application_error_logs": {
+        "time_column": "timestamp",
+        "schema": pa.schema([
+            ("timestamp", pa.string()),
+            ("application", pa.string()),
+            ("server", pa.string()),
+            ("error_type", pa.string()),
+            ("message", pa.string())
+        ])
+    },
+    "telemetry_metrics": {
+        "time_column": "timestamp",
+        "schema": pa.schema([
+            ("timestamp", pa.string()),
+            ("application", pa.string()),
+            ("server", pa.string()),
+            ("response_time", pa.float64()),
+            ("latency", pa.float64()),
+            ("failure_rate", pa.float64())
+        ])
+    }
+}
+
+
+def _to_time_str(value):
+    """Normalise a datetime or 'YYYY-MM-DD[ HH:MM:SS]' string to the format stored in SQLite."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return str(value)
+
+
+def archive_table(conn, table, cutoff_str, archive_root=ARCHIVE_ROOT):
+    """
+    Export rows of `table` from days before `cutoff_str` to Parquet, delete them from SQLite and return the row count.
+
+    The cutoff is floored to midnight so only complete days are exported and each dt= partition is written as a
+    single file. `conn` must not have an open transaction; any pending changes should be committed first.
+    """
+    spec = ARCHIVE_TABLES[table]
+    schema = spec["schema"]
+    time_column = spec["time_column"]
+    cursor = conn.cursor()
+
+    # Refuse to archive if the table has drifted from the archive schema, so no column is silently dropped
+    cursor.execute("PRAGMA table_info({})".format(table))
+    table_columns = [column[1] for column in cursor.fetchall()]
+    if table_columns != schema.names:
+        raise ValueError("Columns of {} {} do not match ARCHIVE_TABLES schema {}".format(
+            table, table_columns, schema.names))
+
+    # Only export whole days: "YYYY-MM-DD HH:MM:SS" -> "YYYY-MM-DD 00:00:00"
+    cutoff_str = _to_time_str(cutoff_str)[:10] + " 00:00:00"
+
+    # Hold the write lock from SELECT to DELETE so no qualifying row can appear in between
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        cursor.execute(
+            "SELECT rowid, {} FROM {} WHERE {} < ? ORDER BY {}, rowid".format(
+                ", ".join(schema.names), table, time_column, time_column),
+            (cutoff_str,)
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            conn.rollback()
+            return 0
+
+        # Group the aged rows by the date part of their time column ("YYYY-MM-DD HH:MM:SS" -> "YYYY-MM-DD")
+        time_index = schema.names.index(time_column) + 1
+        rows_by_date = {}
+        for row in rows:
+            rows_by_date.setdefault(str(row[time_index])[:10], []).append(row)
+
+        for date_str, date_rows in rows_by_date.items():
+            partition_dir = os.path.join(archive_root, table, "dt=" + date_str)
+            os.makedirs(partition_dir, exist_ok=True)
+            arrays = [
+                pa.array([row[i + 1] for row in date_rows], type=field.type)
+                for i, field in enumerate(schema)
+            ]
+            arrow_table = pa.Table.from_arrays(arrays, schema=schema)
+            # Name the file after its first row so a retry after a failed DELETE overwrites it instead of
+            # adding a duplicate; write to a temporary name first so readers never see partial files
+            first_row = date_rows[0]
+            file_name = "part-{}-{}.parquet".format(
+                "".join(ch for ch in str(first_row[time_index]) if ch.isdigit()), first_row[0])
+            tmp_path = os.path.join(partition_dir, "." + file_name + ".tmp")
+            pq.write_table(arrow_table, tmp_path, compression=COMPRESSION)
+            os.replace(tmp_path, os.path.join(partition_dir, file_name))
+
+        # Prune exactly the exported rows, only once every partition file is on disk
+        cursor.executemany(
+            "DELETE FROM {} WHERE rowid = ?".format(table),
+            [(row[0],) for row in rows]
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return len(rows)
+
+
+def query_archive(table, start=None, end=None, columns=None, archive_root=ARCHIVE_ROOT):
+    """
+    Return archived rows of `table` with start <= time column < end as a pandas DataFrame.
+
+    start/end may be datetimes or 'YYYY-MM-DD[ HH:MM:SS]' strings; either can be omitted for an open range.
+    columns restricts which columns are read from disk (default: all columns of the table).
+    """
+    spec = ARCHIVE_TABLES[table]
+    schema = spec["schema"]
+    time_column = spec["time_column"]
+    start_str = _to_time_str(start)
+    end_str = _to_time_str(end)
+    columns = list(columns) if columns is not None else list(schema.names)
+
+    # The time column is needed to filter rows at the edges of the window even if it was not requested
+    read_columns = list(columns)
+    if (start_str or end_str) and time_column not in read_columns:
+        read_columns.append(time_column)
+
+    # Partition pruning: only open dt= directories whose date can overlap [start, end)
+    table_dir = os.path.join(archive_root, table)
+    files = []
+    if os.path.isdir(table_dir):
+        for partition in sorted(os.listdir(table_dir)):
+            if not partition.startswith("dt="):
+                continue
+            date_str = partition[3:]
+            if start_str and date_str < start_str[:10]:
+                continue
+            if end_str and date_str > end_str[:10]:
+                continue
+            partition_dir = os.path.join(table_dir, partition)
+            for file_name in sorted(os.listdir(partition_dir)):
+                if file_name.endswith(".parquet") and not file_name.startswith("."):
+                    files.append(os.path.join(partition_dir, file_name))
+
+    if not files:
+        return pd.DataFrame(columns=columns)
+
+    # Column projection: only the requested columns are decoded from each file
+    arrow_table = pa.concat_tables([pq.read_table(path, columns=read_columns) for path in files])
+    df = arrow_table.to_pandas()
+
+    if start_str:
+        df = df[df[time_column] >= start_str]
+    if end_str:
+        df = df[df[time_column] < end_str]
+    return df[columns].reset_index(drop=True)
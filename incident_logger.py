@@ -4,7 +4,9 @@ insert five new random incident records, possibly link two of them as parent/chi
 You can schedule this function to run every 5 minutes (using cron or a similar scheduler). Over time, the incident_tickets table will only 
 contain recent incidents (last 5 hours), while older ones accumulate in historical_incidents. The incident_dependencies table maintains 
 relationships among active tickets (any relations involving an incident are cleaned up once that incident ages out and is removed from the 
-main table).
+main table). Rows in historical_incidents older than 7 days are exported to date-partitioned Parquet files by
+data_archiver.archive_table() and pruned from the database, so the SQLite file stays small; use
+data_archiver.query_archive() for long-range analysis over the archived history.
 
 Save this script as a .py file and ensure it has execute permissions if needed. You can then set up a cron job (for example, using */5 * * * * python /path/to/incident_manager.py) to run it every 5 minutes.
 """
@@ -14,6 +16,11 @@ import sqlite3
 import random
 from datetime import datetime, timedelta
 
+from data_archiver import archive_table
+
+# How long archived incidents stay in historical_incidents before moving to the Parquet archive
+HISTORY_RETENTION_DAYS = 7
+
 def run_once():
     """Execute one cycle of incident generation and cleanup."""
     # Connect to the SQLite database (will be created if it doesn't exist)
@@ -39,6 +46,7 @@ def run_once():
         )
     """)
     # Create the historical_incidents table (to archive old incidents)
+    # Columns must match data_archiver.ARCHIVE_TABLES["historical_incidents"]
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS historical_incidents (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -186,6 +194,10 @@ def run_once():
     
     # Commit the archival and deletions
     conn.commit()
+
+    # Move complete days of aged history out of SQLite into the Parquet archive
+    history_cutoff = datetime.now() - timedelta(days=HISTORY_RETENTION_DAYS)
+    archive_table(conn, "historical_incidents", history_cutoff.strftime("%Y-%m-%d %H:%M:%S"))
     conn.close()
 
 # If the script is run directly, execute one cycle
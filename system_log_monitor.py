@@ -1,5 +1,5 @@
 """
-Usage: Save this script to a file (e.g., system_log_monitor.py) on your server. Set up a cron job to run it every 5 minutes (as shown above) to continuously insert new log data and purge old records. You can adjust the frequency or retention period as needed.
+Usage: Save this script to a file (e.g., system_log_monitor.py) on your server. Set up a cron job to run it every 5 minutes (as shown above) to continuously insert new log data and archive old records (see data_archiver.py). You can adjust the frequency or retention period as needed.
 """
 
 # Run the monitoring script every 5 minutes  
@@ -33,6 +33,8 @@ import os
 import random
 from datetime import datetime, timedelta
 
+from data_archiver import archive_table
+
 # List of applications and servers (same 5 apps and 50 servers as in related incident management script)
 applications = [f"App{i+1}" for i in range(5)]
 servers = [f"Server{i+1}" for i in range(50)]
@@ -60,6 +62,7 @@ def run_once():
     cursor = conn.cursor()
     
     # Create tables if they do not exist
+    # Columns must match data_archiver.ARCHIVE_TABLES["real_time_monitoring"]
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS real_time_monitoring (
             timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -70,6 +73,7 @@ def run_once():
             network_usage REAL
         )
     """)
+    # Columns must match data_archiver.ARCHIVE_TABLES["application_error_logs"]
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS application_error_logs (
             timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -79,6 +83,7 @@ def run_once():
             message TEXT
         )
     """)
+    # Columns must match data_archiver.ARCHIVE_TABLES["telemetry_metrics"]
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS telemetry_metrics (
             timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -126,15 +131,18 @@ def run_once():
             (now_str, app, server, round(response_time, 2), round(latency, 2), round(failure_rate, 4))
         )
     
-    # Apply 5-hour retention policy: delete data older than 5 hours
+    # Commit the new insertions
+    conn.commit()
+    
+    # Apply 5-hour retention policy: move complete days older than 5 hours to the Parquet archive
+    # (archive_table exports whole days only, so the current day stays in SQLite until midnight + 5 hours)
     cutoff_time = datetime.now() - timedelta(hours=5)
     cutoff_str = cutoff_time.strftime("%Y-%m-%d %H:%M:%S")
-    cursor.execute("DELETE FROM real_time_monitoring WHERE timestamp < ?", (cutoff_str,))
-    cursor.execute("DELETE FROM application_error_logs WHERE timestamp < ?", (cutoff_str,))
-    cursor.execute("DELETE FROM telemetry_metrics WHERE timestamp < ?", (cutoff_str,))
+    archive_table(conn, "real_time_monitoring", cutoff_str)
+    archive_table(conn, "application_error_logs", cutoff_str)
+    archive_table(conn, "telemetry_metrics", cutoff_str)
     
-    # Commit changes and close
-    conn.commit()
+    # Close the connection
     conn.close()
 
 # If this script is run directly, execute one cycle
@@ -0,0 +1,102 @@
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_archiver import archive_table, query_archive
+
+
+class ArchiveRoundTripTest(unittest.TestCase):
+
+    def setUp(self):
+        self.archive_root = tempfile.mkdtemp()
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("""
+            CREATE TABLE telemetry_metrics (
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                application TEXT,
+                server TEXT,
+                response_time REAL,
+                latency REAL,
+                failure_rate REAL
+            )
+        """)
+        rows = [
+            ("2025-01-01 10:00:00", "App1", "Server1", 100.0, 10.0, 0.01),
+            ("2025-01-01 23:59:59", "App2", "Server2", 200.0, None, 0.02),
+            ("2025-01-02 00:00:00", "App3", "Server3", 300.0, 30.0, 0.03),
+            ("2025-01-02 12:00:00", "App4", "Server4", 400.0, 40.0, 0.04),
+            ("2025-01-03 08:00:00", "App5", "Server5", 500.0, 50.0, 0.05),
+        ]
+        self.conn.executemany("INSERT INTO telemetry_metrics VALUES (?, ?, ?, ?, ?, ?)", rows)
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+        shutil.rmtree(self.archive_root)
+
+    def test_exports_complete_days_one_file_per_partition(self):
+        # The cutoff is floored to midnight, so 2025-01-03 stays in SQLite
+        archived = archive_table(self.conn, "telemetry_metrics", "2025-01-03 09:00:00", self.archive_root)
+        self.assertEqual(archived, 4)
+        remaining = self.conn.execute("SELECT timestamp FROM telemetry_metrics").fetchall()
+        self.assertEqual(remaining, [("2025-01-03 08:00:00",)])
+
+        table_dir = os.path.join(self.archive_root, "telemetry_metrics")
+        self.assertEqual(sorted(os.listdir(table_dir)), ["dt=2025-01-01", "dt=2025-01-02"])
+        for partition in os.listdir(table_dir):
+            self.assertEqual(len(os.listdir(os.path.join(table_dir, partition))), 1)
+
+        df = query_archive("telemetry_metrics", archive_root=self.archive_root)
+        self.assertEqual(len(df), 4)
+        self.assertEqual(list(df["application"]), ["App1", "App2", "App3", "App4"])
+
+    def test_end_boundary_is_exclusive(self):
+        archive_table(self.conn, "telemetry_metrics", "2025-01-03 00:00:00", self.archive_root)
+        df = query_archive("telemetry_metrics", start="2025-01-01 10:00:00", end="2025-01-02 00:00:00",
+                           archive_root=self.archive_root)
+        self.assertEqual(list(df["timestamp"]), ["2025-01-01 10:00:00", "2025-01-01 23:59:59"])
+
+    def test_columns_projection_without_time_column(self):
+        archive_table(self.conn, "telemetry_metrics", "2025-01-03 00:00:00", self.archive_root)
+        df = query_archive("telemetry_metrics", start="2025-01-02", columns=["server", "latency"],
+                           archive_root=self.archive_root)
+        self.assertEqual(list(df.columns), ["server", "latency"])
+        self.assertEqual(list(df["server"]), ["Server3", "Server4"])
+
+    def test_retry_after_failed_delete_does_not_duplicate(self):
+        # Make the DELETE fail after the partition files have been written
+        self.conn.execute("""
+            CREATE TRIGGER block_delete BEFORE DELETE ON telemetry_metrics
+            BEGIN SELECT RAISE(ABORT, 'delete blocked'); END
+        """)
+        self.conn.commit()
+        with self.assertRaises(sqlite3.DatabaseError):
+            archive_table(self.conn, "telemetry_metrics", "2025-01-02 00:00:00", self.archive_root)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM telemetry_metrics").fetchone(), (5,))
+
+        self.conn.execute("DROP TRIGGER block_delete")
+        self.conn.commit()
+        self.assertEqual(archive_table(self.conn, "telemetry_metrics", "2025-01-02 00:00:00", self.archive_root), 2)
+        df = query_archive("telemetry_metrics", archive_root=self.archive_root)
+        self.assertEqual(list(df["timestamp"]), ["2025-01-01 10:00:00", "2025-01-01 23:59:59"])
+
+    def test_missing_and_empty_archive(self):
+        df = query_archive("telemetry_metrics", columns=["server"], archive_root=self.archive_root)
+        self.assertTrue(df.empty)
+        self.assertEqual(list(df.columns), ["server"])
+        self.assertEqual(archive_table(self.conn, "telemetry_metrics", "2024-12-31", self.archive_root), 0)
+        self.assertFalse(os.path.exists(os.path.join(self.archive_root, "telemetry_metrics")))
+
+    def test_schema_drift_is_rejected(self):
+        self.conn.execute("ALTER TABLE telemetry_metrics ADD COLUMN region TEXT")
+        with self.assertRaises(ValueError):
+            archive_table(self.conn, "telemetry_metrics", "2025-01-03", self.archive_root)
+
+
+if __name__ == "__main__":
+    unittest.main()